@@ -10,7 +10,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import the FastAPI app and necessary functions from the backend
 from backend.main import app as backend_app
-from backend.main import analyze_python_code, analyze_js_code
+from backend.languages import get_language_pack, supported_extensions
 
 # Create a new FastAPI app for the Vercel serverless function
 app = FastAPI()
@@ -43,20 +43,17 @@ async def analyze_code(file: UploadFile = File(...)):
     """
     # Check file extension
     filename = file.filename
-    if not filename or not (filename.endswith(".py") or filename.endswith(".js") or filename.endswith(".jsx")):
+    language_pack = get_language_pack(filename) if filename else None
+    if language_pack is None:
         raise HTTPException(
             status_code=400, 
-            detail="Invalid file type. Only .py, .js, and .jsx files are supported."
+            detail=f"Invalid file type. Only {', '.join(supported_extensions())} files are supported."
         )
         
     content = await file.read()
-    file_extension = os.path.splitext(filename)[1]
     
     try:
-        if file_extension == ".py":
-            return analyze_python_code(content.decode())
-        else:
-            return analyze_js_code(content.decode())
+        return language_pack.analyze(content.decode())
     except Exception as e:
         raise HTTPException(
             status_code=500,
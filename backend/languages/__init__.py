@@ -0,0 +1,127 @@
+"""
+Language packs for the Code Quality Analyzer.
+
+A language pack is a subpackage of this package. Its __init__ module only
+declares EXTENSIONS, the file extensions it analyzes, so packs can be
+discovered cheaply. Its analyzer module defines:
+- SCORE_MODEL: category -> (max score, penalty per issue, recommendations kept)
+- RULES: category -> function returning a list of issues for the content
+- analyze(content): the analysis result for the content
+
+Analyzer modules are only imported the first time a matching file is
+analyzed, so adding a language does not add to the startup cost.
+
+Rules run on untrusted uploads, so their runtime must stay near-linear in
+the size of the content: a pattern must not rescan the rest of the file
+looking for a closing delimiter from every candidate match.
+test_regex_complexity.py checks every rule against adversarial inputs.
+"""
+import hashlib
+import importlib
+import os
+import pkgutil
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Category -> (max score, penalty per issue, recommendations kept)
+SCORE_MODEL: Dict[str, Tuple[int, int, int]] = {
+    "naming": (10, 2, 2),
+    "modularity": (20, 5, 1),
+    "comments": (20, 5, 1),
+    "formatting": (15, 3, 1),
+    "reusability": (15, 5, 1),
+    "best_practices": (20, 5, 1),
+}
+
+# File extension -> language pack name, filled in on first use
+_language_packs: Dict[str, str] = {}
+
+# Language pack name -> imported analyzer module
+_loaded_packs: Dict[str, ModuleType] = {}
+
+# Hash of the language pack sources, computed on first use
+_rules_version: Optional[str] = None
+
+
+def language_packs() -> Dict[str, str]:
+    """Return the file extension -> language pack mapping, discovering packs on first use."""
+    if not _language_packs:
+        for pack in pkgutil.iter_modules(__path__):
+            if not pack.ispkg:
+                continue
+            metadata = importlib.import_module(f"{__name__}.{pack.name}")
+            for extension in metadata.EXTENSIONS:
+                _language_packs[extension] = pack.name
+    return _language_packs
+
+
+def supported_extensions() -> List[str]:
+    """Return the file extensions that have a language pack."""
+    return sorted(language_packs())
+
+
+def load_language_pack(name: str) -> ModuleType:
+    """Return the analyzer module of a language pack, importing it once."""
+    if name not in _loaded_packs:
+        _loaded_packs[name] = importlib.import_module(f"{__name__}.{name}.analyzer")
+    return _loaded_packs[name]
+
+
+def get_language_pack(filename: str) -> Optional[ModuleType]:
+    """Return the language pack analyzer for a file, importing it on first use."""
+    name = language_packs().get(os.path.splitext(filename)[1])
+    if name is None:
+        return None
+    return load_language_pack(name)
+
+
+def load_language_packs() -> List[str]:
+    """Import every language pack up front, e.g. before forking server workers."""
+    for name in set(language_packs().values()):
+        load_language_pack(name)
+    return loaded_language_packs()
+
+
+def loaded_language_packs() -> List[str]:
+    """Return the names of the language packs imported so far."""
+    return sorted(_loaded_packs)
+
+
+def rules_version() -> str:
+    """Return a hash of the source of every language pack, which changes whenever a rule changes."""
+    global _rules_version
+    if _rules_version is None:
+        digest = hashlib.sha256()
+        package_dir = os.path.dirname(os.path.abspath(__file__))
+        for root, dirs, files in os.walk(package_dir):
+            # Walk in a fixed order so every process computes the same hash
+            dirs[:] = sorted(d for d in dirs if d != "__pycache__")
+            for name in sorted(files):
+                if name.endswith(".py"):
+                    path = os.path.join(root, name)
+                    digest.update(os.path.relpath(path, package_dir).encode() + b"\0")
+                    with open(path, "rb") as f:
+                        digest.update(f.read())
+        _rules_version = digest.hexdigest()
+    return _rules_version
+
+
+def score_code(
+    content: str,
+    score_model: Dict[str, Tuple[int, int, int]],
+    rules: Dict[str, Callable[[str], List[str]]],
+) -> Dict[str, Any]:
+    """Score code by running the rule for each category of the score model."""
+    breakdown = {}
+    recommendations = []
+
+    for category, (max_score, penalty, recommendations_kept) in score_model.items():
+        issues = rules[category](content)
+        breakdown[category] = max_score - min(len(issues) * penalty, max_score)
+        recommendations.extend(issues[:recommendations_kept])
+
+    return {
+        "overall_score": sum(breakdown.values()),
+        "breakdown": breakdown,
+        "recommendations": recommendations[:5]  # Limit to 5 recommendations
+    }
@@ -0,0 +1,35 @@
+"""
+Rules shared by several language packs.
+"""
+import re
+from typing import List
+
+MAGIC_NUMBER_PATTERN = re.compile(r'[^0-9a-zA-Z][0-9]{2,}[^0-9a-zA-Z]')
+
+
+def analyze_duplication(content: str) -> List[str]:
+    """Analyze code for duplicated lines and hard-coded values."""
+    issues = []
+    
+    lines = content.split('\n')
+    clean_lines = [line.strip() for line in lines if line.strip() and not (line.strip().startswith('#') or line.strip().startswith('//') or line.strip().startswith('/*'))]
+    
+    # Simple duplicate code detection
+    code_blocks = {}
+    for i, line in enumerate(clean_lines):
+        if len(line) > 20:  # Only check substantial lines
+            if line in code_blocks:
+                code_blocks[line].append(i)
+            else:
+                code_blocks[line] = [i]
+    
+    duplicates = {line: positions for line, positions in code_blocks.items() if len(positions) > 1}
+    if duplicates:
+        issues.append("Possible code duplication detected. Consider refactoring repeated logic into functions.")
+    
+    # Check for hard-coded values
+    magic_numbers = MAGIC_NUMBER_PATTERN.findall(content)
+    if len(magic_numbers) > 3:
+        issues.append("Replace magic numbers with named constants for better maintainability.")
+    
+    return issues
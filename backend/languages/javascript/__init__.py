@@ -0,0 +1,4 @@
+"""
+JavaScript/JSX language pack. Rules are in the analyzer module, loaded on first use.
+"""
+EXTENSIONS = [".js", ".jsx"]
@@ -0,0 +1,243 @@
+"""
+JavaScript/JSX language pack analyzer.
+"""
+import re
+from typing import Any, Dict, List, Pattern, Set, Tuple
+
+from backend.languages import SCORE_MODEL, score_code
+from backend.languages.common import analyze_duplication
+
+# Rule patterns, compiled once when the pack is loaded. Function heads and
+# onClick handlers are only searched up to the last '{' or '}' in the file, and
+# a useEffect body stops at the next useEffect, so no scan restarts over the
+# whole remaining file for every candidate match.
+# Optional TypeScript syntax after a declared name, so the TypeScript pack can
+# reuse these rules: type parameters ('<T>', one level of nesting) and a type
+# annotation (': Handler'), which stops before the next declaration keyword
+TYPE_PARAMETERS = r'(?:\s*<(?:[^<>]|<[^<>]*>)*>)?'
+TYPE_ANNOTATION = r'(?:\s*:(?:(?!\b(?:function|const|let|var)\b)[^=;{}()])*)?'
+JS_FUNCTION_NAME_PATTERN = re.compile(r'(function|const|let|var)\s+([a-zA-Z0-9_$]+)' + TYPE_PARAMETERS + TYPE_ANNOTATION + r'\s*(?:=\s*)?(\(|=>)')
+JS_FUNCTION_HEAD_PATTERN = re.compile(r'(?:function|const|let|var)\s+([A-Za-z0-9_$]+)' + TYPE_PARAMETERS + TYPE_ANNOTATION + r'\s*(?:=\s*(?:\(\)|\([^()]*\))\s*=>|[=\(][^{]*)\s*{', re.DOTALL)
+JS_FUNCTION_END_PATTERN = re.compile(r'}(?=(?:function|\Z))')
+JSDOC_FUNCTION_PATTERN = re.compile(r'\*/\s*(?:function|const|let|var)\s+([A-Za-z0-9_$]+)')
+REACT_COMPONENT_NAME_PATTERN = re.compile(r'(function|const|class)\s+([a-zA-Z0-9_$]+)\s*(?:extends React\.Component|\(props\)|\(\)\s*{)')
+REACT_COMPONENT_PATTERN = re.compile(r'(function|const|class)\s+([a-zA-Z0-9_$]+)(?:\s+extends\s+React\.Component|\s*=\s*\((?:props|{[^{}]*})\)\s*=>)', re.DOTALL)
+JSDOC_COMPONENT_PATTERN = re.compile(r'\*/\s*(?:function|const|class)\s+([a-zA-Z0-9_$]+)')
+JS_TRY_PATTERN = re.compile(r'\btry\b')
+JS_CATCH_PATTERN = re.compile(r'\bcatch\b')
+JS_CATCH_ALL_PATTERN = re.compile(r'catch\s*\(\s*(?:(?:error|err)\s*)?\)')
+USE_EFFECT_WITHOUT_DEPS_PATTERN = re.compile(r'useEffect\(\s*\(\s*\)\s*=>\s*{(?:(?!useEffect\(\s*\(\s*\)\s*=>\s*{)[^}])*}\s*\)')
+CUSTOM_HOOK_PATTERN = re.compile(r'use[A-Z]')
+ONCLICK_HANDLER_PATTERN = re.compile(r'onClick\s*=\s*{[^}]*}')
+INLINE_STYLE_PATTERN = re.compile(r'style\s*=\s*{\s*{')
+
+
+def find_js_functions(content: str) -> List[Tuple[str, str]]:
+    """Find JavaScript functions as (name, body) pairs.
+
+    A body ends at a '}' that is followed by another function or the end of the file.
+    """
+    functions = []
+    head_limit = content.rfind('{') + 1
+    position = 0
+    while True:
+        head = JS_FUNCTION_HEAD_PATTERN.search(content, position, head_limit)
+        if not head:
+            break
+        body_end = JS_FUNCTION_END_PATTERN.search(content, head.end())
+        if not body_end:
+            break  # No later function can be closed either
+        functions.append((head.group(1), content[head.end():body_end.start()]))
+        position = body_end.end()
+    return functions
+
+
+def find_jsdoc_names(content: str, pattern: Pattern) -> Set[str]:
+    """Find the names declared directly after a JSDoc comment block."""
+    first_jsdoc = content.find('/**')
+    if first_jsdoc == -1:
+        return set()
+    return set(pattern.findall(content, first_jsdoc + 3))
+
+
+def analyze_js_naming(content: str) -> List[str]:
+    """Analyze JavaScript naming conventions."""
+    issues = []
+    
+    # Check for snake_case in functions (should be camelCase)
+    functions = JS_FUNCTION_NAME_PATTERN.findall(content)
+    
+    for func_type, func_name, _ in functions:
+        if '_' in func_name and not func_name.startswith('_'):
+            issues.append(f"Use camelCase for function/variable names in JavaScript (found '{func_name}').")
+    
+    # Check for React component naming (should be PascalCase)
+    components = REACT_COMPONENT_NAME_PATTERN.findall(content)
+    
+    for _, comp_name in components:
+        if comp_name[0].islower():
+            issues.append(f"Use PascalCase for React component names (found '{comp_name}').")
+    
+    return issues
+
+
+def analyze_js_modularity(content: str) -> List[str]:
+    """Analyze JavaScript function length and modularity."""
+    issues = []
+    
+    # Find functions in JS code
+    functions = find_js_functions(content)
+    
+    for func_name, func_body in functions:
+        lines = func_body.count('\n')
+        if lines > 20:
+            issues.append(f"Function '{func_name}' is too long ({lines} lines)—consider refactoring.")
+        
+        # Check for deep nesting
+        brackets_count = 0
+        max_brackets = 0
+        for char in func_body:
+            if char == '{':
+                brackets_count += 1
+                max_brackets = max(max_brackets, brackets_count)
+            elif char == '}':
+                brackets_count -= 1
+        
+        if max_brackets > 3:
+            issues.append(f"Function '{func_name}' has deep nesting—simplify logic.")
+    
+    return issues
+
+
+def analyze_js_comments(content: str) -> List[str]:
+    """Analyze JavaScript comments and documentation."""
+    issues = []
+    
+    # Check for JSDoc comments in functions
+    # Only braces up to the last '{' can close a function signature
+    functions = JS_FUNCTION_HEAD_PATTERN.findall(content, 0, content.rfind('{') + 1)
+    documented_functions = find_jsdoc_names(content, JSDOC_FUNCTION_PATTERN)
+    
+    for func_name in functions:
+        if func_name not in documented_functions:
+            issues.append(f"Add JSDoc comments to document function '{func_name}'.")
+    
+    # Check for comments in React components
+    components = REACT_COMPONENT_PATTERN.findall(content)
+    documented_components = find_jsdoc_names(content, JSDOC_COMPONENT_PATTERN)
+    
+    for _, comp_name in components:
+        if comp_name not in documented_components:
+            issues.append(f"Add JSDoc comments to document React component '{comp_name}'.")
+    
+    # Calculate comment ratio
+    code_lines = [line for line in content.split('\n') if line.strip() and not line.strip().startswith('//') and not line.strip().startswith('/*')]
+    comment_lines = [line for line in content.split('\n') if line.strip() and (line.strip().startswith('//') or line.strip().startswith('/*') or line.strip().startswith('*'))]
+    
+    if len(code_lines) > 10 and len(comment_lines) / len(code_lines) < 0.1:
+        issues.append("Add more comments to explain complex logic (less than 10% comment ratio).")
+    
+    return issues
+
+
+def analyze_js_formatting(content: str) -> List[str]:
+    """Analyze JavaScript formatting and indentation."""
+    issues = []
+    
+    lines = content.split('\n')
+    
+    # Check line length
+    long_lines = [i+1 for i, line in enumerate(lines) if len(line) > 80]
+    if long_lines:
+        issues.append(f"Lines {', '.join(map(str, long_lines[:3]))} exceed the recommended limit of 80 characters.")
+    
+    # Check consistent indentation
+    indent_sizes = set()
+    for line in lines:
+        leading_spaces = len(line) - len(line.lstrip(' '))
+        if leading_spaces > 0:
+            indent_sizes.add(leading_spaces)
+    
+    if len(indent_sizes) > 1 and any(size % 2 != 0 for size in indent_sizes):
+        issues.append("Use consistent indentation (2 or 4 spaces recommended).")
+    
+    # Check for semicolon usage
+    missing_semicolons = [i+1 for i, line in enumerate(lines) 
+                       if line.strip() and not line.strip().startswith('//') 
+                       and not line.strip().startswith('/*')
+                       and not line.strip().endswith('{')
+                       and not line.strip().endswith('}')
+                       and not line.strip().endswith(';')]
+    
+    if missing_semicolons and len(missing_semicolons) > len(lines) * 0.2:
+        issues.append("Use semicolons consistently at the end of statements.")
+    
+    return issues
+
+
+def analyze_js_reusability(content: str) -> List[str]:
+    """Analyze JavaScript code for reusability and DRY (Don't Repeat Yourself) principles."""
+    issues = analyze_duplication(content)
+    
+    # Check for lack of component props validation in React
+    if "React" in content and "prop" in content.lower():
+        if "PropTypes" not in content and "interface" not in content and "type Props" not in content:
+            issues.append("Add prop validation using PropTypes or TypeScript interfaces for React components.")
+    
+    return issues
+
+
+def analyze_js_best_practices(content: str) -> List[str]:
+    """Analyze JavaScript code for best practices in web development."""
+    issues = []
+    
+    # Check for error handling
+    try_blocks = len(JS_TRY_PATTERN.findall(content))
+    catch_blocks = len(JS_CATCH_PATTERN.findall(content))
+    
+    if try_blocks > 0 and try_blocks == catch_blocks and JS_CATCH_ALL_PATTERN.search(content):
+        issues.append("Add error type checking in catch blocks instead of catching all errors.")
+    
+    # Check for modern JS syntax
+    if "var " in content:
+        issues.append("Use 'const' and 'let' instead of 'var' for variable declarations.")
+    
+    # Check for React hooks best practices
+    if "useState" in content or "useEffect" in content:
+        if "useEffect" in content and USE_EFFECT_WITHOUT_DEPS_PATTERN.search(content):
+            issues.append("Add dependency array to useEffect hooks to prevent unnecessary renders.")
+        
+        if not CUSTOM_HOOK_PATTERN.search(content):
+            issues.append("Extract complex logic into custom React hooks for better reusability.")
+    
+    # Check for async/await vs promises
+    if ".then(" in content and "async" not in content:
+        issues.append("Consider using async/await instead of promise chains for better readability.")
+    
+    # Check for proper event handling in React
+    # Handlers can only close at or before the last '}'
+    onclick_handlers = ONCLICK_HANDLER_PATTERN.findall(content, 0, content.rfind('}') + 1)
+    if onclick_handlers and any("bind(this)" in handler for handler in onclick_handlers):
+        issues.append("Use arrow functions or constructor binding for event handlers in React components.")
+    
+    # Check for inline styles
+    if INLINE_STYLE_PATTERN.search(content):
+        issues.append("Extract inline styles into CSS/SCSS files or styled-components for better maintainability.")
+    
+    return issues
+
+
+# Category -> rule, following the order of the score model
+RULES = {
+    "naming": analyze_js_naming,
+    "modularity": analyze_js_modularity,
+    "comments": analyze_js_comments,
+    "formatting": analyze_js_formatting,
+    "reusability": analyze_js_reusability,
+    "best_practices": analyze_js_best_practices,
+}
+
+
+def analyze(content: str) -> Dict[str, Any]:
+    """Analyze JavaScript/JSX code for quality metrics."""
+    return score_code(content, SCORE_MODEL, RULES)
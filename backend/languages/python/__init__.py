@@ -0,0 +1,4 @@
+"""
+Python language pack. Rules are in the analyzer module, loaded on first use.
+"""
+EXTENSIONS = [".py"]
@@ -0,0 +1,237 @@
+"""
+Python language pack analyzer.
+"""
+import re
+from typing import Any, Dict, List, Tuple
+
+from backend.languages import SCORE_MODEL, score_code
+from backend.languages.common import analyze_duplication
+
+# Rule patterns, compiled once when the pack is loaded. Function bodies and list
+# comprehensions are located with plain string searches in the find_* helpers
+# below, so no pattern has to scan ahead for a closing '):' or ']'.
+PYTHON_FUNCTION_NAME_PATTERN = re.compile(r'def\s+([A-Za-z0-9_]+)\s*\(')
+PYTHON_FUNCTION_START_PATTERN = re.compile(r'^def', re.MULTILINE)
+PYTHON_VARIABLE_PATTERN = re.compile(r'(?<![A-Za-z0-9_])[0-9_]*([A-Za-z][A-Za-z0-9_]*)\s*=\s*')
+PYTHON_DOCSTRING_PATTERN = re.compile(r'""".*?"""', re.DOTALL)
+PYTHON_SINGLE_QUOTE_DOCSTRING_PATTERN = re.compile(r"'''.*?'''", re.DOTALL)
+PYTHON_MODULE_DOCSTRING_PATTERN = re.compile(r'(?:""".*?"""|\'\'\'.*?\'\'\')', re.DOTALL)
+PYTHON_TRY_PATTERN = re.compile(r'\btry\b')
+PYTHON_EXCEPT_PATTERN = re.compile(r'\bexcept\b')
+PYTHON_WILDCARD_IMPORT_PATTERN = re.compile(r'from\s+\S+\s+import\s+\*')
+PYTHON_OPEN_ASSIGNMENT_PATTERN = re.compile(r'\b(\w+)\s*=\s*open\(')
+PYTHON_WITH_OPEN_PATTERN = re.compile(r'with\s+open\(')
+PYTHON_FORMAT_CALL_PATTERN = re.compile(r'\.format\(')
+PYTHON_F_STRING_PATTERN = re.compile(r'f[\'"]')
+PYTHON_PYDANTIC_IMPORT_PATTERN = re.compile(r'from\s+pydantic\s+import')
+
+
+def find_python_functions(content: str) -> List[Tuple[str, str]]:
+    """Find Python functions as (name, body) pairs.
+
+    A body runs from the end of the signature to the next top-level 'def'.
+    """
+    functions = []
+    position = 0
+    while True:
+        head = PYTHON_FUNCTION_NAME_PATTERN.search(content, position)
+        if not head:
+            break
+        signature_end = content.find('):', head.end())
+        if signature_end == -1:
+            break  # No later function can have a complete signature either
+        body_start = signature_end + 2
+        next_function = PYTHON_FUNCTION_START_PATTERN.search(content, body_start)
+        body_end = next_function.start() if next_function else len(content)
+        functions.append((head.group(1), content[body_start:body_end]))
+        position = body_end
+    return functions
+
+
+def find_list_comprehensions(content: str) -> List[str]:
+    """Find list comprehensions, at most one per line, spanning the first '[' to the last ']'."""
+    comprehensions = []
+    for line in content.split('\n'):
+        start = line.find('[')
+        end = line.rfind(']')
+        if start == -1 or end < start:
+            continue
+        for_keyword = line.find(' for ', start + 1, end)
+        if for_keyword != -1 and line.find(' in ', for_keyword + 5, end) != -1:
+            comprehensions.append(line[start:end + 1])
+    return comprehensions
+
+
+def analyze_python_naming(content: str) -> List[str]:
+    """Analyze Python naming conventions."""
+    issues = []
+    
+    # Check for camelCase in functions (should be snake_case)
+    func_pattern = PYTHON_FUNCTION_NAME_PATTERN
+    functions = func_pattern.findall(content)
+    
+    for func_name in functions:
+        if any(c.isupper() for c in func_name):
+            issues.append(f"Use snake_case for function names in Python (found '{func_name}').")
+            
+    # Check for non-snake_case variables
+    variables = PYTHON_VARIABLE_PATTERN.findall(content)
+    
+    for var_name in variables:
+        if var_name in ["sum", "list", "dict", "set", "int", "str", "float", "bool", "type", "object"]:
+            issues.append(f"Avoid using '{var_name}' as a variable name—it's a built-in Python name.")
+        if any(c.isupper() for c in var_name) and not var_name.isupper():
+            if not func_pattern.search(f"def {var_name}"):  # Make sure it's not already caught as a function
+                issues.append(f"Use snake_case for variable names in Python (found '{var_name}').")
+    
+    return issues
+
+
+def analyze_python_modularity(content: str) -> List[str]:
+    """Analyze Python function length and modularity."""
+    issues = []
+    
+    # Find functions in Python code
+    functions = find_python_functions(content)
+    
+    for func_name, func_body in functions:
+        lines = func_body.count('\n')
+        if lines > 20:
+            issues.append(f"Function '{func_name}' is too long ({lines} lines)—consider refactoring.")
+        
+        # Check indentation levels (nested blocks)
+        max_indent = 0
+        current_indent = 0
+        for line in func_body.split('\n'):
+            if line.strip() and line.startswith(' ' * 4):
+                indent_level = (len(line) - len(line.lstrip())) // 4
+                current_indent = indent_level
+                max_indent = max(max_indent, current_indent)
+        
+        if max_indent > 3:
+            issues.append(f"Function '{func_name}' has deep nesting (level {max_indent})—simplify logic.")
+    
+    return issues
+
+
+def analyze_python_comments(content: str) -> List[str]:
+    """Analyze Python comments and documentation."""
+    issues = []
+    
+    # Check for docstrings in functions
+    functions = find_python_functions(content)
+    
+    for func_name, func_body in functions:
+        if not PYTHON_DOCSTRING_PATTERN.search(func_body) and not PYTHON_SINGLE_QUOTE_DOCSTRING_PATTERN.search(func_body):
+            issues.append(f"Add a docstring to explain the purpose of function '{func_name}'.")
+    
+    # Check for overall module docstring
+    if not PYTHON_MODULE_DOCSTRING_PATTERN.match(content.strip()):
+        issues.append("Add a module-level docstring at the top of the file.")
+    
+    # Calculate comment ratio
+    code_lines = [line for line in content.split('\n') if line.strip() and not line.strip().startswith('#')]
+    comment_lines = [line for line in content.split('\n') if line.strip() and line.strip().startswith('#')]
+    
+    if len(code_lines) > 10 and len(comment_lines) / len(code_lines) < 0.1:
+        issues.append("Add more comments to explain complex logic (less than 10% comment ratio).")
+    
+    return issues
+
+
+def analyze_python_formatting(content: str) -> List[str]:
+    """Analyze Python formatting and indentation."""
+    issues = []
+    
+    lines = content.split('\n')
+    
+    # Check line length
+    long_lines = [i+1 for i, line in enumerate(lines) if len(line) > 79]
+    if long_lines:
+        issues.append(f"Lines {', '.join(map(str, long_lines[:3]))} exceed the recommended limit of 79 characters.")
+    
+    # Check consistent indentation
+    indent_sizes = set()
+    for line in lines:
+        leading_spaces = len(line) - len(line.lstrip(' '))
+        if leading_spaces > 0 and leading_spaces % 2 == 0:
+            indent_sizes.add(leading_spaces)
+    
+    if len(indent_sizes) > 1 and any(size % 4 != 0 for size in indent_sizes):
+        issues.append("Use consistent indentation (PEP 8 recommends 4 spaces).")
+    
+    # Check for blank lines between functions
+    func_lines = [i for i, line in enumerate(lines) if line.strip().startswith('def ')]
+    for i in range(len(func_lines) - 1):
+        if func_lines[i+1] - func_lines[i] < 3:  # Less than 2 blank lines between functions
+            issues.append("Add two blank lines between function definitions (PEP 8).")
+            break
+    
+    return issues
+
+
+def analyze_python_reusability(content: str) -> List[str]:
+    """Analyze Python code for reusability and DRY (Don't Repeat Yourself) principles."""
+    issues = analyze_duplication(content)
+    
+    # Check for long list comprehensions
+    list_comps = find_list_comprehensions(content)
+    for comp in list_comps:
+        if len(comp) > 60:
+            issues.append("Long list comprehensions are hard to read. Consider breaking down into multiple lines or using a for loop.")
+            break
+    
+    return issues
+
+
+def analyze_python_best_practices(content: str) -> List[str]:
+    """Analyze Python code for best practices in web development."""
+    issues = []
+    
+    # Check for exception handling
+    try_blocks = len(PYTHON_TRY_PATTERN.findall(content))
+    except_blocks = len(PYTHON_EXCEPT_PATTERN.findall(content))
+    
+    if try_blocks > 0 and try_blocks == except_blocks and 'except:' in content:
+        issues.append("Avoid bare 'except:' clauses. Catch specific exceptions instead.")
+    
+    # Check for proper imports
+    if PYTHON_WILDCARD_IMPORT_PATTERN.search(content):
+        issues.append("Avoid wildcard imports (from module import *). Be explicit about what you import.")
+    
+    # Check for context managers when handling files
+    open_calls = PYTHON_OPEN_ASSIGNMENT_PATTERN.findall(content)
+    with_statements = len(PYTHON_WITH_OPEN_PATTERN.findall(content))
+    
+    if open_calls and len(open_calls) > with_statements:
+        issues.append("Use context managers ('with' statement) when working with files.")
+    
+    # Check for f-strings (modern Python)
+    if PYTHON_FORMAT_CALL_PATTERN.search(content) and not PYTHON_F_STRING_PATTERN.search(content):
+        issues.append("Consider using f-strings for string formatting (Python 3.6+).")
+    
+    # Check for FastAPI best practices if applicable
+    if "fastapi" in content.lower():
+        if not PYTHON_PYDANTIC_IMPORT_PATTERN.search(content) and "BaseModel" not in content:
+            issues.append("Use Pydantic models for request/response validation in FastAPI.")
+            
+        if "async def" not in content and "app.add_middleware" in content:
+            issues.append("Consider using async/await for API endpoints to improve concurrency.")
+    
+    return issues
+
+
+# Category -> rule, following the order of the score model
+RULES = {
+    "naming": analyze_python_naming,
+    "modularity": analyze_python_modularity,
+    "comments": analyze_python_comments,
+    "formatting": analyze_python_formatting,
+    "reusability": analyze_python_reusability,
+    "best_practices": analyze_python_best_practices,
+}
+
+
+def analyze(content: str) -> Dict[str, Any]:
+    """Analyze Python code for quality metrics."""
+    return score_code(content, SCORE_MODEL, RULES)
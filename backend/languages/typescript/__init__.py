@@ -0,0 +1,4 @@
+"""
+TypeScript/TSX language pack. Rules are in the analyzer module, loaded on first use.
+"""
+EXTENSIONS = [".ts", ".tsx"]
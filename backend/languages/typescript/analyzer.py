@@ -0,0 +1,33 @@
+"""
+TypeScript/TSX language pack analyzer, built on the JavaScript analysis rules.
+"""
+import re
+from typing import Any, Dict, List
+
+from backend.languages import SCORE_MODEL, score_code
+from backend.languages.javascript.analyzer import RULES as JS_RULES, analyze_js_best_practices
+
+ANY_TYPE_PATTERN = re.compile(r'(?::\s*|<|\bas\s+)any\b')
+TS_IGNORE_PATTERN = re.compile(r'@ts-(?:ignore|nocheck)\b')
+
+
+def analyze_ts_best_practices(content: str) -> List[str]:
+    """Analyze TypeScript code for best practices in web development."""
+    issues = analyze_js_best_practices(content)
+    
+    # Check for escape hatches from the type system
+    if ANY_TYPE_PATTERN.search(content):
+        issues.append("Avoid the 'any' type. Use specific types or 'unknown' instead.")
+    
+    if TS_IGNORE_PATTERN.search(content):
+        issues.append("Fix type errors instead of suppressing them with '@ts-ignore' or '@ts-nocheck'.")
+    
+    return issues
+
+
+RULES = {**JS_RULES, "best_practices": analyze_ts_best_practices}
+
+
+def analyze(content: str) -> Dict[str, Any]:
+    """Analyze TypeScript/TSX code for quality metrics."""
+    return score_code(content, SCORE_MODEL, RULES)
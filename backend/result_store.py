@@ -0,0 +1,116 @@
+"""
+File-backed store for analysis results, shared by all server workers.
+
+The store is enabled by pointing RESULT_STORE_DIR at a directory. Each
+result is saved as a JSON file named after a hash of the rules version,
+the file extension and the content, so every worker can reuse results
+computed by the others, and results of older rules are never served.
+RESULT_STORE_MAX_ENTRIES caps the number of stored results; the least
+recently used ones are evicted first. Eviction scans the whole store, so
+each worker only runs it after saving PRUNE_INTERVAL_RATIO times the cap
+results; in between, each worker can add that many results over the cap.
+"""
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Optional
+
+from backend.languages import rules_version
+
+RESULT_STORE_ENV = "RESULT_STORE_DIR"
+RESULT_STORE_MAX_ENTRIES_ENV = "RESULT_STORE_MAX_ENTRIES"
+DEFAULT_MAX_ENTRIES = 10000
+# Fraction of the cap saved by a worker between two evictions
+PRUNE_INTERVAL_RATIO = 0.1
+
+# Results saved by this process since the store was last pruned
+_saves_since_prune = 0
+
+
+def result_store_dir() -> Optional[str]:
+    """Return the result store directory, or None if the store is disabled."""
+    return os.environ.get(RESULT_STORE_ENV) or None
+
+
+def result_store_max_entries() -> int:
+    """Return the maximum number of results kept in the store."""
+    try:
+        return int(os.environ[RESULT_STORE_MAX_ENTRIES_ENV])
+    except (KeyError, ValueError):
+        return DEFAULT_MAX_ENTRIES
+
+
+def result_key(filename: str, content: bytes) -> str:
+    """Return the store key for a file's content under the current rules."""
+    extension = os.path.splitext(filename)[1].encode()
+    return hashlib.sha256(rules_version().encode() + b"\0" + extension + b"\0" + content).hexdigest()
+
+
+def load_result(key: str) -> Optional[Dict[str, Any]]:
+    """Load a stored result, or return None if it is missing."""
+    store_dir = result_store_dir()
+    if store_dir is None:
+        return None
+    path = os.path.join(store_dir, f"{key}.json")
+    try:
+        with open(path, "r") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Mark the result as recently used so it is evicted last
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return result
+
+
+def save_result(key: str, result: Dict[str, Any]) -> None:
+    """Save a result so that any worker can load it."""
+    store_dir = result_store_dir()
+    if store_dir is None:
+        return
+    # Write to a temporary file first so readers never see a partial result
+    try:
+        fd, temp_path = tempfile.mkstemp(dir=store_dir, suffix=".tmp")
+    except OSError:
+        return  # The store is only a cache; the caller still has the result
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(result, f)
+        os.replace(temp_path, os.path.join(store_dir, f"{key}.json"))
+    except OSError:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return
+    
+    global _saves_since_prune
+    _saves_since_prune += 1
+    max_entries = result_store_max_entries()
+    if _saves_since_prune >= max(1, int(max_entries * PRUNE_INTERVAL_RATIO)):
+        _saves_since_prune = 0
+        prune_results(store_dir, max_entries)
+
+
+def prune_results(store_dir: str, max_entries: int) -> None:
+    """Remove the least recently used results until at most max_entries remain."""
+    entries = []
+    try:
+        with os.scandir(store_dir) as scan:
+            for entry in scan:
+                if entry.name.endswith(".json"):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except OSError:
+                        continue  # Already removed by another worker
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - max(max_entries, 0)]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # Already removed by another worker
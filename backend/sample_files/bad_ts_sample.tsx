@@ -0,0 +1,40 @@
+// React component with code quality issues
+
+import React, { useState, useEffect } from 'react';
+
+function user_list(props: any) {
+    var [users, setUsers] = useState<any[]>([]);
+    var loading_state = false;
+
+    useEffect(() => {
+        fetch("/api/users").then(res => res.json()).then(data => setUsers(data))
+    });
+
+    function filter_users(user_list: any[], min_age: number) {
+        var result = [];
+        for (var i = 0; i < user_list.length; i++) {
+            if (user_list[i].active) {
+                if (user_list[i].age > min_age) {
+                    if (user_list[i].role !== "guest") {
+                        result.push(user_list[i]);
+                    }
+                }
+            }
+        }
+        return result;
+    }
+
+    // @ts-ignore
+    const visible = filter_users(users, props.minAge as any);
+
+    return (
+        <div style={{padding: "20px", background: "#fafafa"}}>
+            <h2 style={{fontSize: "24px", color: "#222"}}>Users</h2>
+            <ul>
+                {visible.map((user, idx) => (
+                    <li key={idx} onClick={props.onSelect.bind(this, user)}>{user.name}</li>
+                ))}
+            </ul>
+        </div>
+    );
+}
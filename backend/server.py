@@ -0,0 +1,83 @@
+"""
+Production server for the Code Quality Analyzer.
+
+Runs uvicorn workers pre-forked by gunicorn. The parent process imports the
+app and every language pack before forking, so the compiled rule patterns
+are shared with the workers through copy-on-write. Workers share a
+file-backed result store and are recycled after a number of requests to
+limit memory growth.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, Optional
+
+from gunicorn.app.base import BaseApplication
+
+from backend.languages import load_language_packs
+from backend.result_store import DEFAULT_MAX_ENTRIES, RESULT_STORE_ENV, RESULT_STORE_MAX_ENTRIES_ENV
+
+DEFAULT_WORKERS = multiprocessing.cpu_count()
+DEFAULT_MAX_REQUESTS = 1000
+
+
+class PreforkServer(BaseApplication):
+    """Gunicorn application that loads the analyzer in the parent process.
+
+    An already imported app can be passed in so it is not imported a second time.
+    """
+
+    def __init__(self, options: Dict[str, Any], application: Any = None):
+        self.options = options
+        self.application = application
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        if self.application is None:
+            from backend.main import app
+            self.application = app
+        load_language_packs()
+        return self.application
+
+
+def run_production_server(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    workers: int = DEFAULT_WORKERS,
+    max_requests: int = DEFAULT_MAX_REQUESTS,
+    result_store_dir: Optional[str] = None,
+    result_store_max_entries: int = DEFAULT_MAX_ENTRIES,
+    app: Any = None,
+) -> None:
+    """Serve the analyzer with pre-forked workers until shut down.
+
+    Results are shared through result_store_dir, or through a temporary
+    directory that is removed on shutdown when none is given.
+    """
+    if result_store_dir is None:
+        store_dir = tempfile.mkdtemp(prefix="code-analyzer-results-")
+        on_exit = lambda server: shutil.rmtree(store_dir, ignore_errors=True)
+    else:
+        store_dir = os.path.abspath(result_store_dir)
+        os.makedirs(store_dir, exist_ok=True)
+        on_exit = lambda server: None
+    os.environ[RESULT_STORE_ENV] = store_dir
+    os.environ[RESULT_STORE_MAX_ENTRIES_ENV] = str(result_store_max_entries)
+
+    options = {
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "uvicorn.workers.UvicornWorker",
+        "preload_app": True,
+        # Recycle each worker after max_requests, staggered so they don't all restart at once
+        "max_requests": max_requests,
+        "max_requests_jitter": max_requests // 10,
+        "graceful_timeout": 30,
+        "on_exit": on_exit,
+    }
+    PreforkServer(options, app).run()
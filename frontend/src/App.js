@@ -41,7 +41,7 @@ function App() {
     <div className="app">
       <header className="app-header">
         <h1>Code Quality Analyzer</h1>
-        <p>Upload a .js, .jsx, or .py file to analyze its code quality</p>
+        <p>Upload a .js, .jsx, .ts, .tsx, or .py file to analyze its code quality</p>
       </header>
       
       <main className="container">
@@ -20,10 +20,10 @@ function FileUploader({ onAnalysisStart, onAnalysisResult, onError }) {
     const file = event.target.files[0];
     if (file) {
       const fileExtension = file.name.split('.').pop().toLowerCase();
-      if (['js', 'jsx', 'py'].includes(fileExtension)) {
+      if (['js', 'jsx', 'ts', 'tsx', 'py'].includes(fileExtension)) {
         setSelectedFile(file);
       } else {
-        onError('Invalid file type. Please select a .js, .jsx, or .py file.');
+        onError('Invalid file type. Please select a .js, .jsx, .ts, .tsx, or .py file.');
         event.target.value = null;
       }
     }
@@ -86,7 +86,7 @@ function FileUploader({ onAnalysisStart, onAnalysisResult, onError }) {
             <input
               id="file-upload"
               type="file"
-              accept=".js,.jsx,.py"
+              accept=".js,.jsx,.ts,.tsx,.py"
               onChange={handleFileChange}
               className="file-input"
             />
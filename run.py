@@ -1,9 +1,35 @@
 """
 Run script for the Code Quality Analyzer backend server.
+
+By default the server runs in development mode with auto-reload. Use
+--production to serve with pre-forked workers instead.
 """
+import argparse
+
 import uvicorn
 
 if __name__ == "__main__":
-    # Run the FastAPI server with reload enabled for development
-    print("Starting Code Quality Analyzer server at http://localhost:8000")
-    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the Code Quality Analyzer backend server.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--production", action="store_true", help="serve with pre-forked workers and no auto-reload")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes (production only)")
+    parser.add_argument("--max-requests", type=int, default=None, help="requests served before a worker is recycled, 0 to never recycle (production only)")
+    parser.add_argument("--result-store-dir", default=None, help="directory of the shared result store, kept on shutdown (production only; default: a temporary directory)")
+    parser.add_argument("--result-store-max-entries", type=int, default=None, help="results kept in the store before the least recently used are evicted (production only)")
+    args = parser.parse_args()
+
+    if args.production:
+        from backend.result_store import DEFAULT_MAX_ENTRIES
+        from backend.server import DEFAULT_MAX_REQUESTS, DEFAULT_WORKERS, run_production_server
+
+        # The defaults live in the server modules, which only load in production mode
+        workers = DEFAULT_WORKERS if args.workers is None else args.workers
+        max_requests = DEFAULT_MAX_REQUESTS if args.max_requests is None else args.max_requests
+        max_entries = DEFAULT_MAX_ENTRIES if args.result_store_max_entries is None else args.result_store_max_entries
+        print(f"Starting Code Quality Analyzer server at http://{args.host}:{args.port} with {workers} workers")
+        run_production_server(args.host, args.port, workers, max_requests, args.result_store_dir, max_entries)
+    else:
+        # Run the FastAPI server with reload enabled for development
+        print(f"Starting Code Quality Analyzer server at http://localhost:{args.port}")
+        uvicorn.run("backend.main:app", host=args.host, port=args.port, reload=True)
@@ -2,8 +2,14 @@
 Test script for the code quality analyzer.
 """
 import json
+import os
+import subprocess
 import sys
-from backend.main import analyze_python_code, analyze_js_code
+from fastapi.testclient import TestClient
+from backend.languages import get_language_pack
+from backend.main import app, analyze_python_code, analyze_js_code, analyze_js_best_practices, analyze_js_comments, analyze_function_modularity
+from backend import result_store
+from backend.result_store import RESULT_STORE_ENV, RESULT_STORE_MAX_ENTRIES_ENV, load_result, result_key, save_result
 
 def test_python_sample():
     """Test the Python analyzer with the sample file."""
@@ -25,6 +31,139 @@ def test_js_sample():
     print(json.dumps(result, indent=2))
     return result
 
+def test_use_effect_without_deps():
+    """Test that a useEffect mentioning useEffect in its body is still flagged."""
+    content = "useEffect(() => {\n // calls useEffect(x) later\n doIt();\n})"
+    issues = analyze_js_best_practices(content)
+    assert "Add dependency array to useEffect hooks to prevent unnecessary renders." in issues
+
+def test_jsdoc_requires_exact_name():
+    """Test that a JSDoc block only documents the function with that exact name."""
+    content = "/** Fetch everything. */\nfunction getAll() {}\nfunction get() {}\n"
+    issues = analyze_js_comments(content)
+    assert "Add JSDoc comments to document function 'get'." in issues
+    assert "Add JSDoc comments to document function 'getAll'." not in issues
+
+def test_ts_sample():
+    """Test the TypeScript language pack with the sample file."""
+    with open('backend/sample_files/bad_ts_sample.tsx', 'r') as f:
+        content = f.read()
+    
+    result = get_language_pack('bad_ts_sample.tsx').analyze(content)
+    print("\n=== TypeScript Sample Analysis ===")
+    print(json.dumps(result, indent=2))
+    assert result["breakdown"]["naming"] < 10
+    assert result["breakdown"]["comments"] < 20
+    assert result["breakdown"]["best_practices"] < 20
+    assert "Use camelCase for function/variable names in JavaScript (found 'filter_users')." in result["recommendations"]
+    return result
+
+def test_ts_typed_declarations():
+    """Test that functions with type parameters or annotations are found in TypeScript."""
+    rules = get_language_pack('items.ts').RULES
+    generic = "function load_items<T>(items: T[]): T[] {\n" + "    items = items.slice(1);\n" * 21 + "}"
+    annotated = "const fetch_user: Handler = (id) => {\n    return id;\n}"
+    
+    assert rules["modularity"](generic) == ["Function 'load_items' is too long (22 lines)—consider refactoring."]
+    for content, name in [(generic, "load_items"), (annotated, "fetch_user")]:
+        assert f"Use camelCase for function/variable names in JavaScript (found '{name}')." in rules["naming"](content)
+        assert f"Add JSDoc comments to document function '{name}'." in rules["comments"](content)
+    assert rules["naming"]("const item_count: number = 5;") == []
+
+def test_legacy_rule_names():
+    """Test that the analyzer names that used to live in backend.main still work."""
+    content = "def f():\n" + "    x = 1\n" * 21
+    assert analyze_function_modularity(content, True) == ["Function 'f' is too long (22 lines)—consider refactoring."]
+    assert analyze_function_modularity(content, False) == []
+
+def test_language_packs_load_lazily():
+    """Test that a language pack is only imported when a matching file arrives."""
+    script = (
+        "import sys\n"
+        "from backend.main import app\n"
+        "from backend.languages import get_language_pack\n"
+        "assert not any(name.endswith('.analyzer') for name in sys.modules)\n"
+        "get_language_pack('component.tsx')\n"
+        "assert 'backend.languages.typescript.analyzer' in sys.modules\n"
+        "assert 'backend.languages.python.analyzer' not in sys.modules\n"
+        "assert get_language_pack('notes.txt') is None\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True)
+
+def test_result_store_shares_results(tmp_path, monkeypatch):
+    """Test that a saved result can be loaded back by key, as another worker would."""
+    monkeypatch.setenv(RESULT_STORE_ENV, str(tmp_path))
+    content = b"def badFunction():\n    return 1\n"
+    key = result_key("sample.py", content)
+    
+    assert load_result(key) is None
+    result = analyze_python_code(content.decode())
+    save_result(key, result)
+    assert load_result(key) == result
+    assert result_key("sample.js", content) != key
+
+def test_rules_change_misses_store(tmp_path, monkeypatch):
+    """Test that results saved under older rules are not served after the rules change."""
+    monkeypatch.setenv(RESULT_STORE_ENV, str(tmp_path))
+    content = b"def badFunction():\n    return 1\n"
+    key = result_key("sample.py", content)
+    save_result(key, analyze_python_code(content.decode()))
+    
+    monkeypatch.setattr(result_store, "rules_version", lambda: "changed rules")
+    changed_key = result_key("sample.py", content)
+    assert changed_key != key
+    assert load_result(changed_key) is None
+
+def test_result_store_evicts_least_recently_used(tmp_path, monkeypatch):
+    """Test that the store keeps at most the configured number of results."""
+    monkeypatch.setenv(RESULT_STORE_ENV, str(tmp_path))
+    for age, key in enumerate(["newest", "used", "oldest"]):
+        save_result(key, {"key": key})
+        os.utime(tmp_path / f"{key}.json", (1000 - age, 1000 - age))
+    
+    monkeypatch.setenv(RESULT_STORE_MAX_ENTRIES_ENV, "2")
+    assert load_result("used") == {"key": "used"}
+    save_result("latest", {"key": "latest"})
+    
+    assert sorted(os.listdir(tmp_path)) == ["latest.json", "used.json"]
+
+def test_ready_endpoint(tmp_path, monkeypatch):
+    """Test that /ready reports the worker, its loaded packs and the result store."""
+    client = TestClient(app)
+    monkeypatch.delenv(RESULT_STORE_ENV, raising=False)
+    assert client.get("/ready").json()["result_store"] is False
+    
+    monkeypatch.setenv(RESULT_STORE_ENV, str(tmp_path))
+    client.post("/analyze-code", files={"file": ("sample.py", b"x = 1\n")})
+    ready = client.get("/ready").json()
+    
+    assert ready["status"] == "ready"
+    assert ready["pid"] == os.getpid()
+    assert "python" in ready["language_packs"]
+    assert ready["result_store"] is True
+
+def test_repeated_upload_served_from_store(tmp_path, monkeypatch):
+    """Test that a second identical upload is not analyzed again."""
+    monkeypatch.setenv(RESULT_STORE_ENV, str(tmp_path))
+    client = TestClient(app)
+    language_pack = get_language_pack("sample.py")
+    calls = []
+    
+    def counting_analyze(content):
+        calls.append(content)
+        return analyze_python_code(content)
+    
+    monkeypatch.setattr(language_pack, "analyze", counting_analyze)
+    upload = {"file": ("sample.py", b"def badFunction():\n    return 1\n")}
+    first = client.post("/analyze-code", files=upload)
+    second = client.post("/analyze-code", files=upload)
+    
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert len(calls) == 1
+    assert len(os.listdir(tmp_path)) == 1
+
 if __name__ == "__main__":
     test_python_sample()
-    test_js_sample() 
\ No newline at end of file
+    test_js_sample()
+    test_ts_sample() 
\ No newline at end of file
@@ -0,0 +1,235 @@
+"""
+Algorithmic-complexity regression suite for the analyzer rules.
+
+Every rule is run against adversarial inputs of growing size and the
+runtime growth is fitted on a log-log scale. A rule fails when its
+runtime grows faster than near-linear in the input size.
+"""
+import math
+import time
+
+import pytest
+
+from backend.languages import common
+from backend.languages.javascript import analyzer as javascript
+from backend.languages.python import analyzer as python
+from backend.languages.typescript import analyzer as typescript
+
+# Input sizes (number of repetitions of the adversarial unit)
+SIZES = [500, 1000, 2000, 4000]
+# Timing repeats per size; the fastest run is kept to reduce noise
+REPEATS = 3
+# Minimum duration of one timed run, so fast rules are not dominated by timer noise
+MIN_RUN_SECONDS = 0.001
+# Highest allowed growth exponent (1.0 is linear, 2.0 is quadratic)
+MAX_EXPONENT = 1.4
+
+
+def _findall(pattern):
+    return lambda content: pattern.findall(content)
+
+
+def _search(pattern):
+    return lambda content: pattern.search(content)
+
+
+def _js_comments_heads(content):
+    return javascript.JS_FUNCTION_HEAD_PATTERN.findall(content, 0, content.rfind('{') + 1)
+
+
+def _onclick_handlers(content):
+    return javascript.ONCLICK_HANDLER_PATTERN.findall(content, 0, content.rfind('}') + 1)
+
+
+# Rule name -> (callable run on the input, {input name: generator of size n})
+RULES = {
+    "python_function_name": (_findall(python.PYTHON_FUNCTION_NAME_PATTERN), {
+        "unclosed_def": lambda n: "def f" * n,
+        "long_name": lambda n: "def " + "a" * n,
+    }),
+    "python_variable": (_findall(python.PYTHON_VARIABLE_PATTERN), {
+        "long_identifier": lambda n: "a" * n,
+        "digit_separated_identifier": lambda n: "a1" * n,
+        "underscore_separated_identifier": lambda n: "a_" * n,
+        "spaces_before_missing_equals": lambda n: "a" + " " * n + "b",
+    }),
+    "python_functions": (python.find_python_functions, {
+        "unclosed_signature": lambda n: "def f(" * n,
+        "many_functions": lambda n: "def f():\n    x = 1\n" * n,
+        "nested_defs": lambda n: "def f(x):\n    def g(y):\n" * n,
+    }),
+    "python_docstring": (_search(python.PYTHON_DOCSTRING_PATTERN), {
+        "unclosed_docstring": lambda n: '"""' + "x" * n,
+    }),
+    "python_module_docstring": (lambda content: python.PYTHON_MODULE_DOCSTRING_PATTERN.match(content), {
+        "unclosed_docstring": lambda n: "'''" + "x" * n,
+    }),
+    "python_wildcard_import": (_search(python.PYTHON_WILDCARD_IMPORT_PATTERN), {
+        "repeated_from": lambda n: "from " * n,
+        "long_module": lambda n: "from " + "a" * n + " import",
+    }),
+    "python_open_assignment": (_findall(python.PYTHON_OPEN_ASSIGNMENT_PATTERN), {
+        "long_identifier": lambda n: "a" * n,
+        "missing_open": lambda n: "f = " * n,
+    }),
+    "list_comprehension": (python.find_list_comprehensions, {
+        "repeated_for": lambda n: "[" + " for " * n,
+        "repeated_for_in": lambda n: "[" + "x for y " * n,
+        "unclosed_brackets": lambda n: "[x for x in y" * n,
+        "many_lines": lambda n: "[x for x in y]\n" * n,
+    }),
+    "js_function_name": (_findall(javascript.JS_FUNCTION_NAME_PATTERN), {
+        "spaces_before_missing_arrow": lambda n: "const a" + " " * n + "x",
+        "repeated_const": lambda n: "const a = " * n,
+        "unclosed_type_parameters": lambda n: "function a<" * n,
+        "nested_type_parameters": lambda n: "function a<T<" * n + ">",
+        "annotations_without_value": lambda n: "const a: T " * n,
+        "long_annotation": lambda n: "const a:" + " T" * n,
+    }),
+    "js_function_head": (_js_comments_heads, {
+        "unclosed_params": lambda n: "const a = (" * n,
+        "unclosed_params_with_braces": lambda n: "const a = ({" * n + "}",
+        "missing_arrow": lambda n: "const a = () x" * n + "{",
+        "unclosed_type_parameters": lambda n: "function a<" * n + "{",
+        "annotations_without_value": lambda n: "const a: T " * n + "{",
+        "long_annotation": lambda n: "const a:" + " T" * n + "{",
+    }),
+    "js_functions": (javascript.find_js_functions, {
+        "unterminated_bodies": lambda n: "function f() { x; }\n" * n,
+        "unclosed_params": lambda n: "const a = (" * n,
+        "terminated_before_paren": lambda n: "const a = ({}function " * n + ")",
+        "deep_braces": lambda n: "function f() {" + "{" * n + "}" * n,
+    }),
+    "jsdoc_functions": (lambda content: javascript.find_jsdoc_names(content, javascript.JSDOC_FUNCTION_PATTERN), {
+        "comments_without_declarations": lambda n: "/** */ " * n,
+        "unclosed_comment": lambda n: "/**" + "*" * n,
+    }),
+    "react_component_name": (_findall(javascript.REACT_COMPONENT_NAME_PATTERN), {
+        "long_name": lambda n: "const " + "a" * n,
+        "repeated_class": lambda n: "class A extends " * n,
+    }),
+    "react_component": (_findall(javascript.REACT_COMPONENT_PATTERN), {
+        "unclosed_destructuring": lambda n: "const A = ({" * n,
+        "unclosed_destructuring_with_brace": lambda n: "const A = ({ " * n + "}",
+    }),
+    "jsdoc_components": (lambda content: javascript.find_jsdoc_names(content, javascript.JSDOC_COMPONENT_PATTERN), {
+        "comments_without_declarations": lambda n: "/** */ class " * n,
+    }),
+    "js_catch_all": (_search(javascript.JS_CATCH_ALL_PATTERN), {
+        "spaces_in_catch": lambda n: "catch (" + " " * n + "x",
+        "repeated_catch": lambda n: "catch (err " * n,
+    }),
+    "use_effect_without_deps": (_search(javascript.USE_EFFECT_WITHOUT_DEPS_PATTERN), {
+        "unclosed_effects": lambda n: "useEffect(() => {" * n,
+        "unclosed_effects_with_brace": lambda n: "useEffect(() => {" * n + "}",
+        "long_body": lambda n: "useEffect(() => {" + "x" * n,
+    }),
+    "onclick_handler": (_onclick_handlers, {
+        "unclosed_handlers": lambda n: "onClick={" * n,
+        "unclosed_handlers_with_brace": lambda n: "}" + "onClick={" * n,
+    }),
+    "inline_style": (_search(javascript.INLINE_STYLE_PATTERN), {
+        "repeated_style": lambda n: "style = { " * n,
+    }),
+    "magic_number": (_findall(common.MAGIC_NUMBER_PATTERN), {
+        "long_number": lambda n: " " + "1" * n,
+    }),
+    "ts_any_type": (_search(typescript.ANY_TYPE_PATTERN), {
+        "repeated_as": lambda n: "as " * n,
+        "spaces_before_type": lambda n: ":" + " " * n + "x",
+    }),
+    "ts_ignore": (_search(typescript.TS_IGNORE_PATTERN), {
+        "repeated_prefix": lambda n: "@ts-" * n,
+    }),
+    "analyze_python_code": (python.analyze, {
+        "unclosed_signature": lambda n: "def f(" * n,
+        "long_list_comprehension": lambda n: "[" + "x for y in z " * n,
+        "long_identifier": lambda n: "a" * n,
+    }),
+    "analyze_js_code": (javascript.analyze, {
+        "unterminated_bodies": lambda n: "function f() { x; }\n" * n,
+        "undocumented_functions": lambda n: "/** */ const a = () => {}\n" * n,
+        "unclosed_effects": lambda n: "useEffect(() => {" * n,
+    }),
+    "analyze_ts_code": (typescript.analyze, {
+        "typed_arrow_functions": lambda n: "const a = (x: any): number => {}\n" * n,
+        "unclosed_generics": lambda n: "useState<any[](" * n,
+        "generic_typed_functions": lambda n: "function a<T>(x: T[]): T[] {}\n" * n,
+        "annotated_arrow_functions": lambda n: "const a: Handler = (x) => {}\n" * n,
+    }),
+}
+
+
+def _run_time(rule, content, loops):
+    """Return the time taken to run a rule the given number of times."""
+    start = time.perf_counter()
+    for _ in range(loops):
+        rule(content)
+    return time.perf_counter() - start
+
+
+def _best_time(rule, content, loops):
+    """Return the fastest of several timed runs of a rule on the given content."""
+    best = min(_run_time(rule, content, loops) for _ in range(REPEATS))
+    return max(best, 1e-9)
+
+
+def _calibrate_loops(rule, content):
+    """Return how many loops of the rule are needed to last MIN_RUN_SECONDS."""
+    single_run = _run_time(rule, content, 1)
+    return max(1, min(1000, math.ceil(MIN_RUN_SECONDS / max(single_run, 1e-7))))
+
+
+def _growth_exponent(sizes, timings):
+    """Fit the slope of log(time) against log(size) by least squares."""
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(timing) for timing in timings]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance
+
+
+def measure_rule(rule_name):
+    """Measure every adversarial input of a rule.
+
+    Returns a list of (input name, growth exponent, sizes, timings), worst first.
+    """
+    rule, inputs = RULES[rule_name]
+    measurements = []
+    for input_name, generate in inputs.items():
+        contents = [generate(n) for n in SIZES]
+        sizes = [len(content) for content in contents]
+        # The same loop count at every size keeps the timings comparable
+        loops = _calibrate_loops(rule, contents[0])
+        timings = [_best_time(rule, content, loops) / loops for content in contents]
+        measurements.append((input_name, _growth_exponent(sizes, timings), sizes, timings))
+    return sorted(measurements, key=lambda measurement: measurement[1], reverse=True)
+
+
+def format_measurement(rule_name, measurement):
+    """Format a single measurement as a readable report line."""
+    input_name, exponent, sizes, timings = measurement
+    points = ", ".join(f"{size} chars: {timing * 1000:.2f}ms" for size, timing in zip(sizes, timings))
+    return f"{rule_name} / {input_name}: exponent {exponent:.2f} ({points})"
+
+
+@pytest.mark.parametrize("rule_name", sorted(RULES))
+def test_rule_scales_near_linearly(rule_name):
+    """Test that a rule stays near-linear on all of its adversarial inputs."""
+    measurements = measure_rule(rule_name)
+    worst = measurements[0]
+    if worst[1] > MAX_EXPONENT:
+        # Timing noise can inflate a single run, so re-measure before failing
+        worst = measure_rule(rule_name)[0]
+    assert worst[1] <= MAX_EXPONENT, (
+        f"Rule grows faster than near-linear (limit {MAX_EXPONENT}). "
+        f"Worst case: {format_measurement(rule_name, worst)}"
+    )
+
+
+if __name__ == "__main__":
+    print("\n=== Rule Complexity Report (worst input per rule) ===")
+    for name in sorted(RULES):
+        print(format_measurement(name, measure_rule(name)[0]))